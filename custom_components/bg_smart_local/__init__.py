@@ -1,18 +1,25 @@
 """The BG Smart Local Control integration."""
+import asyncio
 import logging
+import time
 from datetime import timedelta
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.const import Platform
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN
+from .const import DATA_LAST_RELOCATE, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS = [Platform.LIGHT]
 SCAN_INTERVAL = timedelta(seconds=30)
+# Failed polls or commands in a row before the device is searched for at a new IP
+UNREACHABLE_THRESHOLD = 3
+# Minimum seconds between searches for a device that stays unreachable
+RELOCATE_COOLDOWN = 300
 
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
@@ -34,23 +41,108 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     security_type = 1
     
     device = ESPLocalDevice(host, port, node_id, pop, security_type)
+    relocate_lock = asyncio.Lock()
+    last_relocate = hass.data[DOMAIN].setdefault(DATA_LAST_RELOCATE, {})
+    
+    def _relocate_allowed() -> bool:
+        """Return True if no search is running or ran recently."""
+        return (
+            not relocate_lock.locked()
+            and time.monotonic() - last_relocate.get(entry.entry_id, -RELOCATE_COOLDOWN)
+            >= RELOCATE_COOLDOWN
+        )
+    
+    async def _async_relocate() -> bool:
+        """Search for the device at a new IP and update the entry."""
+        from .discovery import DeviceLocator
+        
+        async with relocate_lock:
+            last_relocate[entry.entry_id] = time.monotonic()
+            other_entries = [
+                other
+                for other in hass.config_entries.async_entries(DOMAIN)
+                if other.entry_id != entry.entry_id
+            ]
+            locator = DeviceLocator(
+                hass,
+                device.host,
+                device.port,
+                pop,
+                security_type,
+                device.node_id,
+                exclude_hosts=[other.data.get("host") for other in other_entries],
+            )
+            new_host = await locator.async_locate()
+            if not new_host:
+                return False
+            
+            if any(other.unique_id == new_host for other in other_entries):
+                _LOGGER.warning(
+                    "Not moving %s to %s: address is used by another entry",
+                    device.host, new_host
+                )
+                return False
+            
+            old_host = device.host
+            device.set_host(new_host)
+            if entry.entry_id in hass.data[DOMAIN]:
+                hass.data[DOMAIN][entry.entry_id]["host"] = new_host
+            
+            title = entry.title
+            if title == f"BG Smart ({old_host})":
+                title = f"BG Smart ({new_host})"
+            hass.config_entries.async_update_entry(
+                entry,
+                title=title,
+                unique_id=new_host,
+                data={**entry.data, "host": new_host},
+            )
+            return True
+    
+    async def _async_relocate_and_refresh() -> None:
+        """Search for the device and poll it straight away if it moved."""
+        if await _async_relocate():
+            await coordinator.async_refresh()
+    
+    async def _async_update_data():
+        """Poll the device, searching for it if it stays unreachable."""
+        params = await device.get_params()
+        if device.consecutive_failures >= UNREACHABLE_THRESHOLD and _relocate_allowed():
+            entry.async_create_background_task(
+                hass, _async_relocate_and_refresh(), f"{DOMAIN}_relocate_{entry.entry_id}"
+            )
+        if params is None:
+            raise UpdateFailed(f"Failed to read params from {device.host}")
+        return params
     
     # Create coordinator for polling
     coordinator = DataUpdateCoordinator(
         hass,
         _LOGGER,
         name="bg_smart_local",
-        update_method=device.get_params,
+        update_method=_async_update_data,
         update_interval=SCAN_INTERVAL,
     )
     
-    # Initial refresh
-    await coordinator.async_config_entry_first_refresh()
+    # Initial refresh, retried once at the device's new IP if it has moved
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except ConfigEntryNotReady:
+        if not _relocate_allowed() or not await _async_relocate():
+            raise
+        await coordinator.async_config_entry_first_refresh()
+    
+    # Persist the node ID the device reports, replacing any typed value,
+    # so it can be found later
+    if device.node_id and entry.data.get("node_id") != device.node_id:
+        hass.config_entries.async_update_entry(
+            entry, data={**entry.data, "node_id": device.node_id}
+        )
     
     hass.data[DOMAIN][entry.entry_id] = {
         "device": device,
         "coordinator": coordinator,
-        "host": host,
+        "host": device.host,
         "port": port
     }
     
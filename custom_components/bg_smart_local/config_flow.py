@@ -1,11 +1,15 @@
 """Config flow for BG Smart Local Control integration."""
+import asyncio
 import logging
+import re
 import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.core import callback
 from homeassistant.const import CONF_HOST, CONF_PORT
+from homeassistant.data_entry_flow import FlowResultType
 from homeassistant.helpers import network
+from homeassistant.helpers.selector import TextSelector, TextSelectorConfig
 
 from .const import DOMAIN
 
@@ -19,14 +23,87 @@ CONF_SECURITY_TYPE = "security_type"
 SECURITY_TYPE_SEC1 = 1
 DEFAULT_PORT = 8080
 
+CONF_DEVICES = "devices"
+# Bulk import validates devices in parallel with a shorter timeout
+BULK_MAX_CONCURRENT = 8
+BULK_TIMEOUT = 5
+# Flow source used to create one entry per device validated by the bulk step
+SOURCE_BULK_DEVICE = "bulk_device"
+
+BULK_DEVICE_SCHEMA = vol.Schema({
+    vol.Required(CONF_HOST): str,
+    vol.Required(CONF_PORT): int,
+    vol.Required(CONF_POP): str,
+    vol.Required(CONF_NODE_ID): str,
+    vol.Required(CONF_SECURITY_TYPE): SECURITY_TYPE_SEC1,
+})
+
+
+async def _async_test_connection(data: dict, timeout: float = 10) -> bool:
+    """Return True if the device answers a property count request."""
+    from .esp_local_control import ESPLocalDevice
+    
+    device = ESPLocalDevice(
+        data[CONF_HOST],
+        data[CONF_PORT],
+        data.get(CONF_NODE_ID, ""),
+        data[CONF_POP],
+        SECURITY_TYPE_SEC1,
+        timeout=timeout,
+    )
+    
+    # Try to get property count to verify connection
+    return await device.get_property_count() > 0
+
+
+def _parse_device_line(line: str) -> dict:
+    """Parse a bulk import line: host[:port] pop [node_id].
+    
+    Fields may be separated by commas or whitespace. The host must be an
+    IPv4 address or hostname; IPv6 literals are not supported.
+    """
+    fields = [field for field in re.split(r"[,\s]+", line.strip()) if field]
+    if len(fields) not in (2, 3):
+        raise ValueError("expected host[:port] pop [node_id]")
+    
+    if fields[0].startswith("[") or fields[0].count(":") > 1:
+        raise ValueError("IPv6 addresses are not supported")
+    
+    host, _, port_str = fields[0].partition(":")
+    if not host:
+        raise ValueError("missing host")
+    
+    port = DEFAULT_PORT
+    if port_str:
+        if not port_str.isdigit() or not 1 <= int(port_str) <= 65535:
+            raise ValueError(f"port must be 1-65535, got {port_str}")
+        port = int(port_str)
+    
+    return {
+        CONF_HOST: host,
+        CONF_PORT: port,
+        CONF_POP: fields[1],
+        CONF_NODE_ID: fields[2] if len(fields) == 3 else "",
+        CONF_SECURITY_TYPE: SECURITY_TYPE_SEC1,
+    }
+
 
 class BGSmartLocalConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for BG Smart Local Control."""
 
     VERSION = 1
 
+    def __init__(self):
+        """Initialize the config flow."""
+        self._bulk_devices = []
+        self._bulk_results = ""
+
     async def async_step_user(self, user_input=None):
         """Handle the initial step."""
+        return self.async_show_menu(step_id="user", menu_options=["manual", "bulk"])
+
+    async def async_step_manual(self, user_input=None):
+        """Handle adding a single device."""
         errors = {}
 
         if user_input is not None:
@@ -35,19 +112,7 @@ class BGSmartLocalConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             
             # Test connection
             try:
-                from .esp_local_control import ESPLocalDevice
-                
-                device = ESPLocalDevice(
-                    user_input[CONF_HOST],
-                    user_input[CONF_PORT],
-                    user_input.get(CONF_NODE_ID, ""),
-                    user_input[CONF_POP],
-                    SECURITY_TYPE_SEC1
-                )
-                
-                # Try to get property count to verify connection
-                count = await device.get_property_count()
-                if count > 0:
+                if await _async_test_connection(user_input):
                     # Create unique ID based on host
                     await self.async_set_unique_id(user_input[CONF_HOST])
                     self._abort_if_unique_id_configured()
@@ -74,7 +139,7 @@ class BGSmartLocalConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         })
 
         return self.async_show_form(
-            step_id="user",
+            step_id="manual",
             data_schema=data_schema,
             errors=errors,
             description_placeholders={
@@ -82,6 +147,143 @@ class BGSmartLocalConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             }
         )
     
+    async def async_step_bulk(self, user_input=None):
+        """Handle adding many devices from a pasted list."""
+        errors = {}
+
+        if user_input is not None:
+            results, self._bulk_devices = await self._async_validate_bulk(
+                user_input[CONF_DEVICES]
+            )
+            self._bulk_results = "\n".join(results)
+            
+            if self._bulk_devices:
+                return await self.async_step_bulk_confirm()
+            errors["base"] = "no_valid_devices"
+
+        return self.async_show_form(
+            step_id="bulk",
+            data_schema=vol.Schema({
+                vol.Required(CONF_DEVICES): TextSelector(
+                    TextSelectorConfig(multiline=True)
+                ),
+            }),
+            errors=errors,
+            description_placeholders={"results": self._bulk_results},
+        )
+
+    async def async_step_bulk_confirm(self, user_input=None):
+        """Show per-device results and add the devices that connected."""
+        if user_input is not None:
+            outcomes = await asyncio.gather(
+                *(self._async_add_bulk_device(data) for data in self._bulk_devices)
+            )
+            return self.async_abort(
+                reason="bulk_added",
+                description_placeholders={
+                    "count": str(sum(added for added, _ in outcomes)),
+                    "results": "\n".join(line for _, line in outcomes),
+                },
+            )
+
+        return self.async_show_form(
+            step_id="bulk_confirm",
+            description_placeholders={
+                "count": str(len(self._bulk_devices)),
+                "results": self._bulk_results,
+            },
+        )
+
+    async def async_step_bulk_device(self, device_data):
+        """Create an entry for one device validated by the bulk step."""
+        try:
+            device_data = BULK_DEVICE_SCHEMA(device_data)
+        except vol.Invalid as ex:
+            _LOGGER.error("Invalid bulk device data: %s", ex)
+            return self.async_abort(reason="invalid_device")
+        
+        await self.async_set_unique_id(device_data[CONF_HOST])
+        self._abort_if_unique_id_configured()
+        
+        return self.async_create_entry(
+            title=f"BG Smart ({device_data[CONF_HOST]})",
+            data=device_data
+        )
+
+    async def _async_add_bulk_device(self, data: dict):
+        """Start a flow creating the entry for one device.
+        
+        Returns whether the entry was created and a result line.
+        """
+        host = data[CONF_HOST]
+        try:
+            result = await self.hass.config_entries.flow.async_init(
+                DOMAIN, context={"source": SOURCE_BULK_DEVICE}, data=data
+            )
+        except Exception as ex:
+            _LOGGER.error("Failed to add %s: %s", host, ex)
+            return False, f"- {host}: failed ({ex})"
+        
+        if result["type"] == FlowResultType.CREATE_ENTRY:
+            return True, f"- {host}: added"
+        if result.get("reason") == "already_configured":
+            return False, f"- {host}: already configured"
+        return False, f"- {host}: not added ({result.get('reason', result['type'])})"
+
+    async def _async_validate_bulk(self, text: str):
+        """Validate every device in a bulk list concurrently.
+        
+        Returns a list of per-device result lines and the data for each
+        device that connected.
+        """
+        configured = self._async_current_ids()
+        semaphore = asyncio.Semaphore(BULK_MAX_CONCURRENT)
+        results = []
+        candidates = {}
+
+        for line in text.splitlines():
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            try:
+                data = _parse_device_line(line)
+            except ValueError as ex:
+                results.append(f"- `{line}`: invalid ({ex})")
+                continue
+            
+            host = data[CONF_HOST]
+            if host in configured:
+                results.append(f"- {host}: already configured")
+            elif host in candidates:
+                results.append(f"- {host}: duplicate, skipped")
+            else:
+                candidates[host] = data
+
+        async def _async_check(data: dict) -> bool:
+            async with semaphore:
+                try:
+                    return await _async_test_connection(data, timeout=BULK_TIMEOUT)
+                except Exception as ex:
+                    _LOGGER.debug("Failed to connect to %s: %s", data[CONF_HOST], ex)
+                    return False
+
+        outcomes = await asyncio.gather(
+            *(_async_check(data) for data in candidates.values())
+        )
+
+        valid = []
+        for data, connected in zip(candidates.values(), outcomes):
+            if connected:
+                valid.append(data)
+                results.append(f"- {data[CONF_HOST]}: connected")
+            else:
+                results.append(f"- {data[CONF_HOST]}: cannot connect")
+        
+        _LOGGER.info(
+            "Bulk import: %d of %d devices connected", len(valid), len(candidates)
+        )
+        return results, valid
+    
     async def _get_ha_local_ip(self) -> str:
         """Get Home Assistant's local IP address."""
         try:
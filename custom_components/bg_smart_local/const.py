@@ -1,3 +1,8 @@
 """Constants for the BG Smart Local Control integration."""
 
 DOMAIN = "bg_smart_local"
+
+# Addresses seen answering ESP Local Control requests, shared across entries
+DATA_RESPONDERS = "responders"
+# Time of the last address search per config entry, kept across setup retries
+DATA_LAST_RELOCATE = "last_relocate"
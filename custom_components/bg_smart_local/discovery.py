@@ -0,0 +1,181 @@
+"""Locate a BG Smart device on the local network after its IP changes."""
+import asyncio
+import ipaddress
+import logging
+from typing import Iterable, List, Optional, Set
+
+from homeassistant.core import HomeAssistant
+
+from .const import DATA_RESPONDERS, DOMAIN
+from .log_helpers import ThrottledLogger
+
+_LOGGER = logging.getLogger(__name__)
+
+ARP_TABLE = "/proc/net/arp"
+# Tight timeouts keep a full /24 sweep within a few seconds
+PORT_CHECK_TIMEOUT = 0.5
+PROBE_TIMEOUT = 2.0
+MAX_CONCURRENT_PROBES = 32
+
+
+def _read_arp_table_sync() -> List[str]:
+    """Read resolved IPv4 neighbours from the kernel ARP table."""
+    hosts = []
+    try:
+        with open(ARP_TABLE, encoding="utf-8") as arp:
+            next(arp, None)  # Header line
+            for line in arp:
+                fields = line.split()
+                # Flags 0x0 marks an incomplete entry
+                if len(fields) >= 3 and fields[2] != "0x0":
+                    hosts.append(fields[0])
+    except OSError as ex:
+        _LOGGER.debug("Could not read ARP table: %s", ex)
+    return hosts
+
+
+def _subnet_hosts(host: str) -> List[str]:
+    """Return every address in the /24 around host."""
+    try:
+        network = ipaddress.ip_network(f"{host}/24", strict=False)
+    except ValueError:
+        return []
+    return [str(addr) for addr in network.hosts()]
+
+
+async def _async_port_open(host: str, port: int) -> bool:
+    """Check whether a TCP port accepts connections."""
+    try:
+        _, writer = await asyncio.wait_for(
+            asyncio.open_connection(host, port), PORT_CHECK_TIMEOUT
+        )
+    except (OSError, asyncio.TimeoutError):
+        return False
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except OSError:
+        pass
+    return True
+
+
+class DeviceLocator:
+    """Search candidate addresses for a device with a known node ID.
+
+    Channel names are not unique across dimmers of the same model and the
+    PoP is not checked by the transport, so the node ID is the only
+    identity accepted.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        old_host: str,
+        port: int,
+        pop: str,
+        security_type: int,
+        node_id: str,
+        exclude_hosts: Optional[Iterable[str]] = None,
+    ) -> None:
+        """Initialize locator."""
+        self.hass = hass
+        self.old_host = old_host
+        self.port = port
+        self.pop = pop
+        self.security_type = security_type
+        self.node_id = node_id
+        self.exclude_hosts: Set[str] = set(exclude_hosts or [])
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_PROBES)
+        self._responders: Set[str] = hass.data.setdefault(DOMAIN, {}).setdefault(
+            DATA_RESPONDERS, set()
+        )
+        # One throttled log for every probe, so hosts that are not ESP
+        # devices report at most one error of each kind per search
+        self._probe_log = ThrottledLogger(_LOGGER, f"search {old_host}")
+
+    async def _async_probe(self, host: str) -> Optional[str]:
+        """Probe one address, returning it if the expected device answers."""
+        from .esp_local_control import ESPLocalDevice
+
+        async with self._semaphore:
+            if not await _async_port_open(host, self.port):
+                return None
+
+            device = ESPLocalDevice(
+                host,
+                self.port,
+                "",
+                self.pop,
+                self.security_type,
+                timeout=PROBE_TIMEOUT,
+                log=self._probe_log,
+            )
+            properties = await device.get_property_values()
+
+        if not properties:
+            return None
+
+        self._responders.add(host)
+        if device.node_id == self.node_id:
+            return host
+
+        _LOGGER.debug("Device at %s does not match %s", host, self.old_host)
+        return None
+
+    async def _async_search(self, hosts: Iterable[str]) -> Optional[str]:
+        """Probe hosts concurrently and return the first match."""
+        tasks = [asyncio.create_task(self._async_probe(host)) for host in hosts]
+        if not tasks:
+            return None
+
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                found = await next_done
+                if found:
+                    return found
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        return None
+
+    async def async_locate(self) -> Optional[str]:
+        """Find the device's new address.
+
+        Addresses already known to answer (earlier probes and the ARP
+        table) are tried first; the rest of the /24 is swept only if none
+        of them match.
+        """
+        if not self.node_id:
+            _LOGGER.warning(
+                "Cannot search for %s: its node ID is not known", self.old_host
+            )
+            return None
+
+        _LOGGER.info("Searching for device previously at %s", self.old_host)
+
+        arp_hosts = await self.hass.async_add_executor_job(_read_arp_table_sync)
+        subnet = _subnet_hosts(self.old_host)
+        in_subnet = set(subnet)
+        # Hosts of other configured devices can never be this device
+        tried = {self.old_host} | self.exclude_hosts
+
+        known = [
+            host
+            for host in dict.fromkeys(list(self._responders) + arp_hosts)
+            if host not in tried and (not in_subnet or host in in_subnet)
+        ]
+        tried.update(known)
+
+        found = await self._async_search(known)
+        if not found:
+            found = await self._async_search(
+                host for host in subnet if host not in tried
+            )
+
+        if found:
+            _LOGGER.info("Found device previously at %s at %s", self.old_host, found)
+        else:
+            _LOGGER.warning("Could not find device previously at %s", self.old_host)
+        return found
@@ -9,8 +9,13 @@ from functools import partial
 
 import aiohttp
 
+from .log_helpers import ThrottledLogger
+
 _LOGGER = logging.getLogger(__name__)
 
+# Property index of the "params" JSON holding every channel's state
+PARAMS_INDEX = 1
+
 # Lazy import of protobuf to avoid blocking event loop
 _pb = None
 _PROTOBUF_AVAILABLE = None
@@ -44,23 +49,47 @@ async def _get_protobuf(loop):
 class ESPLocalDevice:
     """ESP Local Control Device - Final Implementation."""
     
-    def __init__(self, host: str, port: int, node_id: str, pop: str, security_type: int):
-        """Initialize device."""
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        node_id: str,
+        pop: str,
+        security_type: int,
+        timeout: float = 10,
+        log: Optional[ThrottledLogger] = None,
+    ):
+        """Initialize device.
+        
+        A shared log can be passed so that many short-lived devices (such
+        as network probes) are throttled together.
+        """
         self.host = host
         self.port = port
         self.node_id = node_id
         self.pop = pop
         self.security_type = security_type
+        self.timeout = timeout
         self.base_url = f"http://{host}:{port}"
         self.control_path = "esp_local_ctrl/control"
         self.property_count = -1
+        self.consecutive_failures = 0
         self._params_cache = {}
+        self._log = log or ThrottledLogger(_LOGGER, host)
         
-        _LOGGER.info(
+        _LOGGER.debug(
             "Initialized ESPLocalDevice: host=%s, port=%s, security=%s",
             host, port, security_type
         )
     
+    def set_host(self, host: str) -> None:
+        """Point the device at a new address, keeping cached state."""
+        _LOGGER.info("Device %s moved to %s", self.host, host)
+        self.host = host
+        self.base_url = f"http://{host}:{self.port}"
+        self.consecutive_failures = 0
+        self._log = ThrottledLogger(_LOGGER, host)
+    
     async def _send_protobuf_request(self, message) -> Optional[bytes]:
         """Send protobuf request and get response."""
         url = f"{self.base_url}/{self.control_path}"
@@ -72,7 +101,9 @@ class ESPLocalDevice:
             "Connection": "Keep-Alive"
         }
         
-        _LOGGER.debug("Sending protobuf request to %s (payload: %d bytes)", url, len(payload))
+        self._log.sampled_debug(
+            "request", "Sending protobuf request to %s (payload: %d bytes)", url, len(payload)
+        )
         
         try:
             async with aiohttp.ClientSession() as session:
@@ -80,22 +111,31 @@ class ESPLocalDevice:
                     url, 
                     data=payload, 
                     headers=headers, 
-                    timeout=aiohttp.ClientTimeout(total=10)
+                    timeout=aiohttp.ClientTimeout(total=self.timeout)
                 ) as response:
                     if response.status == 200:
                         body = await response.read()
-                        _LOGGER.debug("Received response: %d bytes", len(body))
+                        self.consecutive_failures = 0
+                        self._log.sampled_debug(
+                            "response", "Received response: %d bytes", len(body)
+                        )
+                        self._log.resolve("connection", "Connection restored")
+                        self._log.resolve("http")
                         return body
                     else:
-                        _LOGGER.error("HTTP error: %s", response.status)
+                        self.consecutive_failures += 1
                         text = await response.text()
-                        _LOGGER.error("Response body: %s", text)
+                        self._log.error(
+                            "http", "HTTP error: %s, response body: %s", response.status, text
+                        )
                         return None
-        except aiohttp.ClientError as e:
-            _LOGGER.error("Connection error: %s", e)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self.consecutive_failures += 1
+            self._log.error("connection", "Connection error: %s", e)
             return None
         except Exception as e:
-            _LOGGER.error("Unexpected error: %s", e, exc_info=True)
+            self.consecutive_failures += 1
+            self._log.error("unexpected", "Unexpected error: %s", e, exc_info=True)
             return None
     
     async def get_property_count(self) -> int:
@@ -120,7 +160,7 @@ class ESPLocalDevice:
         
         response_data = await self._send_protobuf_request(request)
         if not response_data:
-            _LOGGER.error("Failed to get property count")
+            self._log.error("get_prop_count", "Failed to get property count")
             return -1
         
         try:
@@ -131,19 +171,26 @@ class ESPLocalDevice:
                 status = response.resp_get_prop_count.status
                 if status == pb.Success:
                     self.property_count = response.resp_get_prop_count.count
-                    _LOGGER.info("Property count: %d", self.property_count)
+                    self._log.resolve("get_prop_count")
+                    _LOGGER.debug("Property count: %d", self.property_count)
                     return self.property_count
                 else:
-                    _LOGGER.error("Get property count failed with status: %s", status)
+                    self._log.error(
+                        "get_prop_count", "Get property count failed with status: %s", status
+                    )
             else:
-                _LOGGER.error("Response does not contain resp_get_prop_count")
+                self._log.error(
+                    "get_prop_count", "Response does not contain resp_get_prop_count"
+                )
         except Exception as e:
-            _LOGGER.error("Failed to parse response: %s", e, exc_info=True)
+            self._log.error("parse", "Failed to parse response: %s", e, exc_info=True)
         
         return -1
     
-    async def get_property_values(self) -> Optional[Dict[str, Any]]:
-        """Get all property values from device."""
+    async def get_property_values(
+        self, indices: Optional[List[int]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Get property values from device (all properties by default)."""
         loop = asyncio.get_running_loop()
         pb = await _get_protobuf(loop)
         
@@ -153,21 +200,24 @@ class ESPLocalDevice:
         
         _LOGGER.debug("Getting property values")
         
-        count = await self.get_property_count()
-        if count <= 0:
-            _LOGGER.error("Invalid property count: %d", count)
-            return None
+        # Explicit indices need no property count round trip
+        if indices is None:
+            count = await self.get_property_count()
+            if count <= 0:
+                self._log.error("get_prop_vals", "Invalid property count: %d", count)
+                return None
+            indices = list(range(count))
         
         request = pb.LocalCtrlMessage(
             msg=pb.TypeCmdGetPropertyValues,
             cmd_get_prop_vals=pb.CmdGetPropertyValues(
-                indices=list(range(count))
+                indices=indices
             )
         )
         
         response_data = await self._send_protobuf_request(request)
         if not response_data:
-            _LOGGER.error("Failed to get property values")
+            self._log.error("get_prop_vals", "Failed to get property values")
             return None
         
         try:
@@ -175,12 +225,14 @@ class ESPLocalDevice:
             response.ParseFromString(response_data)
             
             if not response.HasField('resp_get_prop_vals'):
-                _LOGGER.error("Response does not contain resp_get_prop_vals")
+                self._log.error(
+                    "get_prop_vals", "Response does not contain resp_get_prop_vals"
+                )
                 return None
             
             if response.resp_get_prop_vals.status != pb.Success:
-                _LOGGER.error("Get property values failed with status: %s", 
-                            response.resp_get_prop_vals.status)
+                self._log.error("get_prop_vals", "Get property values failed with status: %s", 
+                                response.resp_get_prop_vals.status)
                 return None
             
             properties = {}
@@ -192,19 +244,36 @@ class ESPLocalDevice:
                     prop_value = json.loads(prop_value_str)
                     
                     properties[prop_name] = prop_value
-                    _LOGGER.debug("Property '%s': %s", prop_name, prop_value)
+                    self._log.sampled_debug(
+                        "property", "Property '%s': %s", prop_name, prop_value
+                    )
                     
                     if prop_name == "params":
                         self._params_cache = prop_value
+                    elif prop_name == "config" and isinstance(prop_value, dict):
+                        # The node ID the device reports is its real identity
+                        reported_node_id = prop_value.get("node_id")
+                        if reported_node_id and reported_node_id != self.node_id:
+                            if self.node_id:
+                                self._log.warning(
+                                    "node_id",
+                                    "Configured node ID %s differs from the device's %s, "
+                                    "using the device's",
+                                    self.node_id, reported_node_id
+                                )
+                            self.node_id = reported_node_id
                         
                 except Exception as e:
-                    _LOGGER.error("Failed to parse property %s: %s", prop_info.name, e)
+                    self._log.error(
+                        "parse_property", "Failed to parse property %s: %s", prop_info.name, e
+                    )
             
-            _LOGGER.info("Retrieved %d properties from device", len(properties))
+            self._log.resolve("get_prop_vals")
+            _LOGGER.debug("Retrieved %d properties from %s", len(properties), self.host)
             return properties
             
         except Exception as e:
-            _LOGGER.error("Failed to parse response: %s", e, exc_info=True)
+            self._log.error("parse", "Failed to parse response: %s", e, exc_info=True)
             return None
     
     async def set_property_values(self, params_json: Dict[str, Any]) -> bool:
@@ -226,7 +295,7 @@ class ESPLocalDevice:
             cmd_set_prop_vals=pb.CmdSetPropertyValues(
                 props=[
                     pb.PropertyValue(
-                        index=1,  # Index 1 is "params"
+                        index=PARAMS_INDEX,
                         value=json_bytes
                     )
                 ]
@@ -235,7 +304,7 @@ class ESPLocalDevice:
         
         response_data = await self._send_protobuf_request(request)
         if not response_data:
-            _LOGGER.error("Failed to set property values")
+            self._log.error("set_prop_vals", "Failed to set property values")
             return False
         
         try:
@@ -243,11 +312,14 @@ class ESPLocalDevice:
             response.ParseFromString(response_data)
             
             if not response.HasField('resp_set_prop_vals'):
-                _LOGGER.error("Response does not contain resp_set_prop_vals")
+                self._log.error(
+                    "set_prop_vals", "Response does not contain resp_set_prop_vals"
+                )
                 return False
             
             if response.resp_set_prop_vals.status == pb.Success:
-                _LOGGER.info("Set property values successful")
+                self._log.resolve("set_prop_vals")
+                _LOGGER.debug("Set property values successful on %s", self.host)
                 
                 # Update cache with the new values
                 for device_name, params in params_json.items():
@@ -260,28 +332,53 @@ class ESPLocalDevice:
                 
                 return True
             else:
-                _LOGGER.error("Set property values failed with status: %s",
-                            response.resp_set_prop_vals.status)
+                self._log.error("set_prop_vals", "Set property values failed with status: %s",
+                                response.resp_set_prop_vals.status)
                 return False
                 
         except Exception as e:
-            _LOGGER.error("Failed to parse response: %s", e, exc_info=True)
+            self._log.error("parse", "Failed to parse response: %s", e, exc_info=True)
             return False
     
-    async def get_params(self) -> Dict[str, Any]:
-        """Get current device params."""
+    async def get_params(self) -> Optional[Dict[str, Any]]:
+        """Read current device params.
+        
+        The first read fetches every property (including the node config
+        that carries the node ID); later polls request only "params".
+        Returns None if the device could not be read.
+        """
         _LOGGER.debug("Getting params")
         
-        if not self._params_cache:
-            properties = await self.get_property_values()
-            if properties and "params" in properties:
-                self._params_cache = properties["params"]
-                _LOGGER.debug("Cached params: %s", self._params_cache)
-            else:
-                _LOGGER.warning("No params found in properties")
+        indices = [PARAMS_INDEX] if self.property_count > 0 else None
+        properties = await self.get_property_values(indices)
+        if properties is None:
+            return None
         
+        if not isinstance(properties.get("params"), dict):
+            self._log.warning("no_params", "No params found in properties")
+            return None
+        
+        self._log.resolve("no_params")
+        self._params_cache = properties["params"]
+        self._log.sampled_debug("params", "Cached params: %s", self._params_cache)
         return self._params_cache
     
+    async def get_channel_params(self, device_name: str) -> Optional[Dict[str, Any]]:
+        """Read back the current params of a single channel.
+        
+        Only the "params" property is requested, in a single request
+        without a property count lookup.
+        """
+        properties = await self.get_property_values([PARAMS_INDEX])
+        if not properties or not isinstance(properties.get("params"), dict):
+            return None
+        
+        channel_params = properties["params"].get(device_name)
+        if not isinstance(channel_params, dict):
+            return None
+        
+        return channel_params
+    
     async def set_param(self, device_name: str, param_name: str, value: Any) -> bool:
         """Set a specific parameter.
         
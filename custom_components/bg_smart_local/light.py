@@ -8,17 +8,22 @@ from homeassistant.components.light import (
     LightEntity,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
     DataUpdateCoordinator,
 )
 
 from .const import DOMAIN
+from .log_helpers import ThrottledLogger
 
 _LOGGER = logging.getLogger(__name__)
 
+# Seconds to wait after a command before reading the channel back
+VERIFY_DELAY = 2
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -35,7 +40,7 @@ async def async_setup_entry(
     try:
         # Get device parameters from coordinator
         params = coordinator.data
-        _LOGGER.info("Device params: %s", params)
+        _LOGGER.debug("Device params: %s", params)
         
         if not params:
             _LOGGER.error("No params found in device properties")
@@ -76,6 +81,11 @@ class BGSmartDimmer(CoordinatorEntity, LightEntity):
         
         self._device = device
         self._device_name = device_name
+        self._log = ThrottledLogger(_LOGGER, device_name)
+        self._expected_params = {}
+        self._cancel_verify = None
+        self._verify_task = None
+        self._command_seq = 0
         
         # Use the "Name" parameter if available, otherwise use device_name
         friendly_name = device_params.get("Name", device_name)
@@ -114,18 +124,84 @@ class BGSmartDimmer(CoordinatorEntity, LightEntity):
         if self.coordinator.data and self._device_name in self.coordinator.data:
             device_params = self.coordinator.data[self._device_name]
             self._update_from_params(device_params)
-            _LOGGER.debug(
-                "%s updated from coordinator - Power: %s, Brightness: %s%%", 
-                self._device_name, self._attr_is_on,
+            self._log.sampled_debug(
+                "coordinator_update",
+                "Updated from coordinator - Power: %s, Brightness: %s%%",
+                self._attr_is_on,
                 int((self._attr_brightness / 255) * 100) if self._attr_brightness else 0
             )
         self.async_write_ha_state()
     
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel any pending or in-flight read-back when the entity is removed."""
+        if self._cancel_verify:
+            self._cancel_verify()
+            self._cancel_verify = None
+        if self._verify_task and not self._verify_task.done():
+            self._verify_task.cancel()
+        self._verify_task = None
+        await super().async_will_remove_from_hass()
+    
+    def _schedule_verify(self, expected_params: dict) -> None:
+        """Schedule a deferred read-back of this channel after a command.
+        
+        Replaces the full coordinator refresh: only this entity is updated
+        and the result is folded into the coordinator's data.
+        """
+        if self._cancel_verify:
+            self._cancel_verify()
+        self._expected_params = expected_params
+        self._cancel_verify = async_call_later(
+            self.hass, VERIFY_DELAY, self._start_verify
+        )
+    
+    @callback
+    def _start_verify(self, _now) -> None:
+        """Start the read-back as a task that is cancelled on removal."""
+        self._cancel_verify = None
+        self._verify_task = self.hass.async_create_task(self._async_verify())
+    
+    async def _async_verify(self) -> None:
+        """Read back this channel and update the entity from it."""
+        expected_params = self._expected_params
+        command_seq = self._command_seq
+        
+        channel_params = await self._device.get_channel_params(self._device_name)
+        if command_seq != self._command_seq:
+            # A newer command was sent while reading; its read-back applies
+            _LOGGER.debug("Discarding stale read-back of %s", self._device_name)
+            return
+        
+        if channel_params is None:
+            # Keep the optimistic state; the next poll will correct it
+            _LOGGER.debug("Read-back of %s failed", self._device_name)
+            return
+        
+        if self.coordinator.data is not None:
+            self.coordinator.data[self._device_name] = channel_params
+        
+        mismatched = {
+            name: channel_params.get(name)
+            for name, value in expected_params.items()
+            if channel_params.get(name) != value
+        }
+        if mismatched:
+            self._log.warning(
+                "verify", "Device did not apply %s, reports %s",
+                expected_params, mismatched
+            )
+        else:
+            self._log.resolve("verify")
+        
+        self._update_from_params(channel_params)
+        self.async_write_ha_state()
+    
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on the light."""
         brightness = kwargs.get(ATTR_BRIGHTNESS)
         
         _LOGGER.debug("Turn on %s, brightness=%s", self._device_name, brightness)
+        self._command_seq += 1
         
         try:
             # Determine target brightness
@@ -139,7 +215,7 @@ class BGSmartDimmer(CoordinatorEntity, LightEntity):
                 else:
                     brightness_pct = 100
             
-            _LOGGER.info("Setting %s: Power=True, brightness=%s%%", self._device_name, brightness_pct)
+            _LOGGER.debug("Setting %s: Power=True, brightness=%s%%", self._device_name, brightness_pct)
             
             # Set brightness first
             success = await self._device.set_param(
@@ -168,10 +244,10 @@ class BGSmartDimmer(CoordinatorEntity, LightEntity):
             self._attr_brightness = int((brightness_pct / 100) * 255)
             self.async_write_ha_state()
             
-            # Request coordinator refresh
-            await self.coordinator.async_request_refresh()
+            # Confirm just this channel instead of refreshing the whole device
+            self._schedule_verify({"Power": True, "brightness": brightness_pct})
             
-            _LOGGER.info("Successfully turned on %s at brightness %s%%", 
+            _LOGGER.debug("Successfully turned on %s at brightness %s%%", 
                         self._device_name, brightness_pct)
             
         except Exception as ex:
@@ -180,6 +256,7 @@ class BGSmartDimmer(CoordinatorEntity, LightEntity):
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the light."""
         _LOGGER.debug("Turn off %s", self._device_name)
+        self._command_seq += 1
         
         try:
             success = await self._device.set_param(
@@ -193,10 +270,10 @@ class BGSmartDimmer(CoordinatorEntity, LightEntity):
                 self._attr_is_on = False
                 self.async_write_ha_state()
                 
-                # Request coordinator refresh
-                await self.coordinator.async_request_refresh()
+                # Confirm just this channel instead of refreshing the whole device
+                self._schedule_verify({"Power": False})
                 
-                _LOGGER.info("Successfully turned off %s", self._device_name)
+                _LOGGER.debug("Successfully turned off %s", self._device_name)
             else:
                 _LOGGER.error("Failed to turn off %s", self._device_name)
                 
@@ -0,0 +1,104 @@
+"""Rate-limited and sampled logging helpers for BG Smart Local Control."""
+import logging
+import time
+from typing import Dict, Optional
+
+# Repeated errors with the same key are logged at most once per interval
+DEFAULT_ERROR_INTERVAL = 300.0
+# Sampled debug traces are emitted once every N calls per key
+DEFAULT_DEBUG_SAMPLE_RATE = 20
+
+
+class ThrottledLogger:
+    """Wrap a logger with per-key rate limiting, sampling and counters.
+
+    One instance is created per device so an offline dimmer only reports
+    its connection error once per interval instead of on every poll.
+    Arguments are only formatted when a message is actually emitted.
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        prefix: str = "",
+        error_interval: float = DEFAULT_ERROR_INTERVAL,
+        debug_sample_rate: int = DEFAULT_DEBUG_SAMPLE_RATE,
+    ) -> None:
+        """Initialize throttled logger."""
+        self.logger = logger
+        self.prefix = prefix
+        self.error_interval = error_interval
+        self.debug_sample_rate = max(1, debug_sample_rate)
+        self.suppressed: Dict[str, int] = {}
+        self.sampled_out: Dict[str, int] = {}
+        self._last_logged: Dict[str, float] = {}
+
+    def _emit(self, level: int, msg: str, args, kwargs) -> None:
+        """Emit a message with the device prefix."""
+        if self.prefix:
+            msg = "[%s] " + msg
+            args = (self.prefix,) + args
+        self.logger.log(level, msg, *args, **kwargs)
+
+    def _throttled(self, level: int, key: str, msg: str, args, kwargs) -> None:
+        """Log at most once per interval for the given key."""
+        if not self.logger.isEnabledFor(level):
+            return
+
+        now = time.monotonic()
+        last = self._last_logged.get(key)
+        if last is not None and now - last < self.error_interval:
+            self.suppressed[key] = self.suppressed.get(key, 0) + 1
+            return
+
+        self._last_logged[key] = now
+        count = self.suppressed.pop(key, 0)
+        if count:
+            msg = msg + " (%d similar messages suppressed)"
+            args = args + (count,)
+        self._emit(level, msg, args, kwargs)
+
+    def error(self, key: str, msg: str, *args, **kwargs) -> None:
+        """Log a rate-limited error."""
+        self._throttled(logging.ERROR, key, msg, args, kwargs)
+
+    def warning(self, key: str, msg: str, *args, **kwargs) -> None:
+        """Log a rate-limited warning."""
+        self._throttled(logging.WARNING, key, msg, args, kwargs)
+
+    def sampled_debug(self, key: str, msg: str, *args, **kwargs) -> None:
+        """Log a debug trace once every debug_sample_rate calls.
+
+        The emitted trace reports how many were skipped since the last one.
+        """
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+
+        skipped = self.sampled_out.get(key)
+        if skipped is not None and skipped + 1 < self.debug_sample_rate:
+            self.sampled_out[key] = skipped + 1
+            return
+
+        self.sampled_out[key] = 0
+        if skipped:
+            msg = msg + " (%d similar traces skipped)"
+            args = args + (skipped,)
+        self._emit(logging.DEBUG, msg, args, kwargs)
+
+    def resolve(self, key: str, msg: Optional[str] = None, *args) -> None:
+        """Clear throttling for a key once the condition has recovered.
+
+        If an error had been logged for the key, the optional recovery
+        message is logged at INFO together with the suppressed count.
+        """
+        if self._last_logged.pop(key, None) is None:
+            return
+
+        count = self.suppressed.pop(key, 0)
+        if msg and self.logger.isEnabledFor(logging.INFO):
+            self._emit(
+                logging.INFO,
+                msg + " (%d similar messages suppressed)",
+                args + (count,),
+                {},
+            )